@@ -3,4 +3,6 @@ from .base import Event
 from .elo import EloRater, ExponentiallySmoothedEloRater
 from .trueskill import TrueskillRater, ExponentiallySmoothedTrueskillRater
 from . import datasets
+from . import bootstrap
+from . import sampling
 from . import tsa
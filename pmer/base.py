@@ -213,8 +213,12 @@ class Rater(RaterVisualisationMixin):
             predictions.append(winners_pwin)
         return predictions
 
+    def process_events(self, events):
+        """Update ratings with events ordered by date."""
+        for event in events:
+            self.update_ratings(event)
+
     def process_dataset(self, dataset):
         """Calculate ratings that result from the provided dataset."""
-        for event in dataset:
-            self.update_ratings(event)
+        self.process_events(dataset)
         self.player_names = dataset.player_names
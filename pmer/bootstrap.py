@@ -0,0 +1,130 @@
+"""
+Bootstrap confidence intervals for ratings and evaluation metrics.
+
+Resamples are drawn by pmer.sampling as arrays of event indices, so
+events are shared between resamples rather than copied into new datasets.
+"""
+import multiprocessing
+
+import numpy as np
+
+from .evaluation import logloss_for_events
+from .sampling import resample_indices, subsample_masks
+
+
+class BootstrapResult(object):
+    """
+    Percentile intervals obtained from bootstrap resamples.
+
+    Attributes:
+        ratings: A mapping of player ids to (low, high) final rating bounds.
+        ranks: A mapping of player ids to (low, high) leaderboard rank bounds.
+            Ranks start at 1.
+        counts: A mapping of player ids to the number of resamples
+            the player appears in. Intervals of a player are computed
+            from that many values only.
+        logloss: (low, high) bounds of the mean log loss per event.
+            The mean doesn't depend on the resample size, which varies
+            for subsamples drawn without replacement.
+        n_resamples: Total number of resamples.
+    """
+
+    def __init__(self, ratings, ranks, counts, logloss, n_resamples):
+        self.ratings = ratings
+        self.ranks = ranks
+        self.counts = counts
+        self.logloss = logloss
+        self.n_resamples = n_resamples
+
+
+def bootstrap(rater_factory, dataset, n_resamples=200, confidence=0.95, p=None, seed=None, processes=None):
+    """
+    Estimate uncertainty of ratings and log loss by bootstrapping events.
+
+    Every resample is processed by a fresh rater in a process pool.
+    Each resample gets its own seed derived from `seed`, so results
+    don't depend on the number of processes or scheduling.
+
+    Args:
+        rater_factory: Picklable callable returning a new rater,
+            e.g. a rater class or a functools.partial of it.
+        dataset: Dataset to draw resamples from.
+        n_resamples: Number of bootstrap resamples.
+        confidence: Coverage of the percentile intervals.
+        p: Probability to retain an event in a subsample drawn without
+            replacement. By default resamples are drawn with replacement.
+        seed: Seed for reproducible resamples.
+        processes: Number of worker processes. Defaults to CPU count.
+
+    Returns:
+        BootstrapResult instance.
+    """
+    if n_resamples < 1:
+        raise ValueError('n_resamples must be positive, got {}'.format(n_resamples))
+    if not 0 < confidence < 1:
+        raise ValueError('confidence must be in (0, 1), got {}'.format(confidence))
+    if p is not None and not 0 < p <= 1:
+        raise ValueError('p must be in (0, 1], got {}'.format(p))
+
+    resample_seeds = np.random.RandomState(seed).randint(0, 2**31 - 1, size=n_resamples)
+    tasks = [(rater_factory, resample_seed, p) for resample_seed in resample_seeds]
+    with multiprocessing.Pool(processes, initializer=_init_worker, initargs=(dataset.events,)) as pool:
+        outcomes = pool.starmap(_run_resample, tasks)
+
+    player_ratings = {}
+    player_ranks = {}
+    loglosses = []
+    for leaderboard, logloss in outcomes:
+        for rank, (player_id, rating) in enumerate(leaderboard, start=1):
+            player_ratings.setdefault(player_id, []).append(rating)
+            player_ranks.setdefault(player_id, []).append(rank)
+        loglosses.append(logloss)
+
+    percentiles = [50 * (1 - confidence), 50 * (1 + confidence)]
+    ratings = {player_id: _percentile_bounds(values, percentiles)
+               for player_id, values in player_ratings.items()}
+    ranks = {player_id: _rank_bounds(values, confidence)
+             for player_id, values in player_ranks.items()}
+    counts = {player_id: len(values) for player_id, values in player_ranks.items()}
+    logloss = _percentile_bounds(loglosses, percentiles)
+    return BootstrapResult(ratings, ranks, counts, logloss, n_resamples)
+
+
+# Events shared by all resamples in a worker process.
+_worker_events = None
+
+
+def _init_worker(events):
+    global _worker_events  # pylint: disable=global-statement
+    _worker_events = events
+
+
+def _run_resample(rater_factory, seed, p):
+    """Process a single resample and return its leaderboard and mean log loss."""
+    if p is None:
+        indices = resample_indices(len(_worker_events), 1, random_state=seed)[0]
+    else:
+        indices = np.flatnonzero(subsample_masks(len(_worker_events), 1, p, random_state=seed)[0])
+    events = [_worker_events[i] for i in indices]
+    rater = rater_factory()
+    errors = logloss_for_events([rater], events)
+    return rater.make_leaderboard(), errors[0] / max(len(events), 1)
+
+
+def _rank_bounds(ranks, confidence):
+    """
+    Percentile bounds of ranks that are ranks themselves.
+
+    The lower bound is rounded down and the upper one up
+    to the nearest observed rank.
+    """
+    ranks = np.sort(ranks)
+    last = len(ranks) - 1
+    low = ranks[int(np.floor(last * (1 - confidence) / 2))]
+    high = ranks[int(np.ceil(last * (1 + confidence) / 2))]
+    return int(low), int(high)
+
+
+def _percentile_bounds(values, percentiles):
+    low, high = np.percentile(values, percentiles)
+    return float(low), float(high)
@@ -2,3 +2,4 @@
 from .dota2 import Dota2Dataset
 from .lol import LolDataset
 from .soccer import SoccerDataset
+from .tail import CsvTail
@@ -3,10 +3,10 @@ import datetime
 import csv
 import operator
 import os
-import random
 
 from .. import conf
 from .. import Event
+from ..sampling import subsample_masks
 
 
 class BaseDataset(object):
@@ -29,18 +29,56 @@ class BaseDataset(object):
         with open(path) as f:
             reader = csv.DictReader(f)
             for row in reader:
-                date = datetime.datetime.strptime(row['date'], cls._date_format)
-                winners = ast.literal_eval(row['winners'])
-                losers = ast.literal_eval(row['losers'])
-                event = Event(winners=winners, losers=losers, date=date)
-                events.append(event)
+                events.append(cls.event_from_row(row))
         return cls(events)
 
+    @classmethod
+    def event_from_row(cls, row):
+        """Construct an event from a CSV row mapping column names to values."""
+        date = datetime.datetime.strptime(row['date'], cls._date_format)
+        winners = ast.literal_eval(row['winners'])
+        losers = ast.literal_eval(row['losers'])
+        return Event(winners=winners, losers=losers, date=date)
+
     def __init__(self, events):
         """Construct a dataset from randomly ordered events."""
         events = sorted(events, key=operator.attrgetter('date'))
         self.events = events
 
+    def append(self, events):
+        """
+        Add a batch of events keeping the dataset sorted by date.
+
+        Only the new events and the existing events dated after the
+        earliest of them are merged, so appending recent events costs
+        time proportional to the batch rather than to the whole dataset.
+        Events with equal dates keep their existing order, new ones last.
+
+        Args:
+            events: Iterable of events in any order.
+
+        Returns:
+            Index of the first event that was added or moved by the merge.
+            Events before it are unchanged.
+        """
+        key = operator.attrgetter('date')
+        events = sorted(events, key=key)
+        if not events:
+            return len(self.events)
+
+        # Find where the out-of-order tail starts.
+        start = len(self.events)
+        earliest_date = events[0].date
+        while start > 0 and self.events[start - 1].date > earliest_date:
+            start -= 1
+
+        if start == len(self.events):
+            self.events.extend(events)
+        else:
+            # Sorting is stable and merges two sorted runs in linear time.
+            self.events[start:] = sorted(self.events[start:] + events, key=key)
+        return start
+
     def __getitem__(self, key):
         return self.events[key]
 
@@ -50,13 +88,16 @@ class BaseDataset(object):
     def __len__(self):
         return len(self.events)
 
-    def subsample(self, p):
+    def subsample(self, p, random_state=None):
         """
         Take a random subsample of this dataset.
 
         Args:
             p: Probability to retain an event.
+            random_state: Seed or numpy RandomState.
+                Defaults to the global numpy random state.
         """
-        events_subsample = [e for e in self.events if random.random() < p]
+        mask = subsample_masks(len(self.events), 1, p, random_state=random_state)[0]
+        events_subsample = [e for e, retain in zip(self.events, mask) if retain]
         subsampled_dataset = type(self)(events_subsample)
         return subsampled_dataset
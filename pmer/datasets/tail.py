@@ -0,0 +1,111 @@
+import csv
+import io
+import locale
+import os
+
+from .. import conf
+from .base import BaseDataset
+
+
+class CsvTail(object):
+    """
+    Follow a growing CSV file and read only the rows appended since the last read.
+
+    Typical usage is to build the dataset from the first read and then
+    periodically feed new rows to the dataset and a rater:
+
+        tail = CsvTail('dota2.csv', Dota2Dataset)
+        dataset = Dota2Dataset(tail.read())
+        rater.process_dataset(dataset)
+        ...
+        tail.update(dataset, rater)
+    """
+
+    def __init__(self, filename, dataset_class=BaseDataset):
+        self._path = os.path.join(conf.DATASET_DIR, filename)
+        self._dataset_class = dataset_class
+        self._fieldnames = None
+        # Byte offset of the first row that hasn't been read yet.
+        self._offset = 0
+        # Device and inode of the file being followed.
+        self._file_id = None
+
+    def read(self):
+        """
+        Return events from the rows appended since the previous call.
+
+        A trailing row that isn't terminated with a newline is considered
+        to be still written and is left for the next call.
+
+        Raises:
+            IOError: The file was truncated or replaced since the previous call.
+        """
+        events, position = self._read()
+        self._commit(position)
+        return events
+
+    def update(self, dataset, rater=None):
+        """
+        Append new events to a dataset and optionally pass them to a rater.
+
+        The rater receives only the new events, so it can't accept events
+        older than the last one in the dataset. Such a batch is rejected
+        and neither the dataset nor the read position changes, so the
+        rows can be read again with `read`, e.g. to rebuild the rater.
+
+        Returns:
+            List of dataset events from the earliest new one to the end.
+            Unless new events were merged in the middle of the dataset,
+            these are exactly the new events.
+
+        Raises:
+            ValueError: A rater is given and some new events are older
+                than the last event in the dataset.
+        """
+        events, position = self._read()
+        if rater is not None and events and len(dataset) > 0:
+            earliest_date = min(event.date for event in events)
+            if earliest_date < dataset[-1].date:
+                raise ValueError('new events are older than the ones already processed, '
+                                 'rater has to be rebuilt from the dataset')
+        self._commit(position)
+        start = dataset.append(events)
+        events = dataset[start:]
+        if rater is not None:
+            rater.process_events(events)
+        return events
+
+    def _read(self):
+        """Parse new rows without moving the read position."""
+        with open(self._path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            file_id = (stat.st_dev, stat.st_ino)
+            if self._file_id is not None and file_id != self._file_id:
+                raise IOError('{} was replaced after {} bytes were read'.format(self._path, self._offset))
+            if stat.st_size < self._offset:
+                raise IOError('{} was truncated to {} bytes after {} bytes were read'.format(
+                    self._path, stat.st_size, self._offset))
+            f.seek(self._offset)
+            data = f.read()
+
+        # Stop after the last complete row.
+        # A newline inside an open quoted field doesn't end a row.
+        end = data.rfind(b'\n') + 1
+        while end > 0 and data.count(b'"', 0, end) % 2:
+            end = data.rfind(b'\n', 0, end - 1) + 1
+
+        # Decode the same way as the text mode file in BaseDataset.from_csv.
+        text = data[:end].decode(locale.getpreferredencoding(False))
+        f = io.StringIO(text, newline='')
+        fieldnames = self._fieldnames
+        if fieldnames is None:
+            fieldnames = next(csv.reader(f), None)
+
+        reader = csv.DictReader(f, fieldnames=fieldnames)
+        events = [self._dataset_class.event_from_row(row) for row in reader]
+        position = (self._offset + end, fieldnames, file_id)
+        return events, position
+
+    def _commit(self, position):
+        """Move the read position past the rows returned by `_read`."""
+        self._offset, self._fieldnames, self._file_id = position
@@ -22,6 +22,11 @@ def events_from_csv(filename):
 
 def logloss_for_dataset(raters, filename):
     events = events_from_csv(filename)
+    return logloss_for_events(raters, events)
+
+
+def logloss_for_events(raters, events):
+    """Sum log loss of predicting each event before updating raters with it."""
     errors = np.zeros(len(raters))
     for event in events:
         for i, rater in enumerate(raters):
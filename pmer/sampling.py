@@ -0,0 +1,50 @@
+"""
+Vectorized random sampling of events.
+
+Samples are represented by arrays of event indices or boolean masks,
+so events don't have to be copied.
+"""
+import numpy as np
+
+
+def resample_indices(n_events, n_resamples, random_state=None):
+    """
+    Draw bootstrap resamples of events with replacement.
+
+    Indices within each resample are sorted, so for a dataset sorted by
+    date the selected events stay in chronological order.
+
+    Returns:
+        Array of shape (n_resamples, n_events).
+    """
+    random_state = check_random_state(random_state)
+    indices = random_state.randint(0, n_events, size=(n_resamples, n_events))
+    indices.sort(axis=1)
+    return indices
+
+
+def subsample_masks(n_events, n_resamples, p, random_state=None):
+    """
+    Draw random subsamples of events without replacement.
+
+    Args:
+        p: Probability to retain an event.
+
+    Returns:
+        Boolean array of shape (n_resamples, n_events).
+    """
+    random_state = check_random_state(random_state)
+    return random_state.random_sample((n_resamples, n_events)) < p
+
+
+def check_random_state(random_state):
+    """
+    Turn a seed into a numpy RandomState.
+
+    None means the global numpy random state, so np.random.seed() applies.
+    """
+    if random_state is None:
+        return np.random.mtrand._rand  # pylint: disable=protected-access
+    if isinstance(random_state, np.random.RandomState):
+        return random_state
+    return np.random.RandomState(random_state)